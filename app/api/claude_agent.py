@@ -278,8 +278,7 @@ async def _gather_bigquery_context(
             # Enhance with table details
             for table_info in tables:
                 table_id = table_info["table_id"]
-                table_details = bigquery_service.get_table(dataset_id, table_id)
-                table_info["schema"] = table_details.get("schema", [])
+                table_info["schema"] = bigquery_service.get_table_schema(dataset_id, table_id)
 
             datasets[0]["tables"] = tables
 
@@ -298,8 +297,7 @@ async def _gather_bigquery_context(
                 for table_info in tables:
                     table_id = table_info["table_id"]
                     try:
-                        table_details = bigquery_service.get_table(ds_id, table_id)
-                        table_info["schema"] = table_details.get("schema", [])
+                        table_info["schema"] = bigquery_service.get_table_schema(ds_id, table_id)
                     except:
                         table_info["schema"] = []
 
@@ -320,7 +318,3 @@ async def _gather_bigquery_context(
             "location": "US",
             "datasets": []
         }
-
-
-# Import BaseModel
-from pydantic import BaseModel, Field
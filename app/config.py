@@ -1,6 +1,8 @@
 """
 Application Configuration using Pydantic Settings
 """
+import json
+import os
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
@@ -29,6 +31,10 @@ class Settings(BaseSettings):
         default="US",
         description="BigQuery dataset location"
     )
+    bigquery_use_information_schema: bool = Field(
+        default=False,
+        description="List datasets via one INFORMATION_SCHEMA query (bigquery_location only)"
+    )
 
     # FastAPI Configuration
     fastapi_env: str = Field(
@@ -89,7 +95,6 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
@@ -99,7 +104,6 @@ class Settings(BaseSettings):
         """Validate Google Cloud credentials path"""
         # In Cloud Run, credentials are optional (uses default service account)
         # Only validate in local development
-        import os
         if os.getenv("FASTAPI_ENV", "development") == "development":
             if not v:
                 raise ValueError(
@@ -10,6 +10,8 @@ import sys
 
 from app.config import settings
 from app.api import health, datasets, tables, query, claude_agent
+from app.services.bigquery_service import bigquery_service
+from app.services.claude_cli_service import claude_cli_service
 
 
 # Configure logger
@@ -40,7 +42,6 @@ async def lifespan(app: FastAPI):
 
     # Test BigQuery connection
     try:
-        from app.services.bigquery_service import bigquery_service
         bq_connected = bigquery_service.test_connection()
         if bq_connected:
             logger.info("✓ BigQuery connection successful")
@@ -51,7 +52,6 @@ async def lifespan(app: FastAPI):
 
     # Check Claude CLI availability
     try:
-        from app.services.claude_cli_service import claude_cli_service
         claude_available = claude_cli_service.is_available()
         if claude_available:
             logger.info("✓ Claude Code CLI available")
@@ -117,7 +117,6 @@ async def root():
     """Root endpoint"""
     claude_status = "unknown"
     try:
-        from app.services.claude_cli_service import claude_cli_service
         claude_status = "available" if claude_cli_service.is_available() else "unavailable"
     except:
         pass
@@ -3,7 +3,10 @@ BigQuery Service Layer
 Handles all BigQuery operations
 """
 import time
+from threading import RLock
 from typing import List, Dict, Any, Optional
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from google.cloud import bigquery
 from google.cloud.bigquery import Dataset, Table, Client, QueryJobConfig
 from google.api_core.exceptions import GoogleAPIError
@@ -12,6 +15,14 @@ from loguru import logger
 from app.config import settings
 
 
+# Table schema cache shared across agent requests (schema lookups repeat a lot)
+_table_cache = TTLCache(maxsize=1024, ttl=300)
+_table_cache_lock = RLock()
+
+# Page size for table listings; the client default needs many more round trips
+TABLES_PAGE_SIZE = 1000
+
+
 class BigQueryService:
     """Service for interacting with Google BigQuery"""
 
@@ -49,6 +60,9 @@ class BigQueryService:
         Returns:
             List of datasets with metadata
         """
+        if settings.bigquery_use_information_schema:
+            return self._list_datasets_from_information_schema()
+
         try:
             datasets = list(self.client.list_datasets())
             result = []
@@ -61,7 +75,7 @@ class BigQueryService:
                 dataset_info = self.client.get_dataset(dataset_ref)
 
                 # Count tables
-                tables = list(self.client.list_tables(dataset_ref))
+                tables = list(self.client.list_tables(dataset_ref, page_size=TABLES_PAGE_SIZE))
                 tables_count = len(tables)
 
                 result.append({
@@ -83,6 +97,57 @@ class BigQueryService:
             logger.error(f"Unexpected error listing datasets: {e}")
             raise
 
+    def _list_datasets_from_information_schema(self) -> List[Dict[str, Any]]:
+        """
+        List datasets and their table counts with a single query
+
+        Reads the region-qualified INFORMATION_SCHEMA views instead of
+        calling get_dataset and list_tables for every dataset, so only
+        datasets in the configured BigQuery location are returned.
+
+        Returns:
+            List of datasets with metadata
+        """
+        region = f"region-{settings.bigquery_location.lower()}"
+        sql = f"""
+            SELECT
+              s.schema_name,
+              s.location,
+              s.creation_time,
+              s.last_modified_time,
+              COUNT(t.table_name) AS tables_count
+            FROM `{self.project_id}`.`{region}`.INFORMATION_SCHEMA.SCHEMATA AS s
+            LEFT JOIN `{self.project_id}`.`{region}`.INFORMATION_SCHEMA.TABLES AS t
+              ON t.table_schema = s.schema_name
+            GROUP BY s.schema_name, s.location, s.creation_time, s.last_modified_time
+            ORDER BY s.schema_name
+        """
+
+        try:
+            rows = self.client.query(sql).result()
+
+            result = [
+                {
+                    "dataset_id": row["schema_name"],
+                    "project": self.project_id,
+                    "location": row["location"],
+                    "tables_count": row["tables_count"],
+                    "created_at": row["creation_time"],
+                    "modified_at": row["last_modified_time"]
+                }
+                for row in rows
+            ]
+
+            logger.info(f"Listed {len(result)} datasets from INFORMATION_SCHEMA")
+            return result
+
+        except GoogleAPIError as e:
+            logger.error(f"Failed to list datasets from INFORMATION_SCHEMA: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error listing datasets from INFORMATION_SCHEMA: {e}")
+            raise
+
     def get_dataset(self, dataset_id: str) -> Dict[str, Any]:
         """
         Get details of a specific dataset
@@ -98,7 +163,7 @@ class BigQueryService:
             dataset = self.client.get_dataset(dataset_ref)
 
             # Count tables
-            tables = list(self.client.list_tables(dataset_ref))
+            tables = list(self.client.list_tables(dataset_ref, page_size=TABLES_PAGE_SIZE))
             tables_count = len(tables)
 
             result = {
@@ -120,19 +185,20 @@ class BigQueryService:
             logger.error(f"Unexpected error getting dataset {dataset_id}: {e}")
             raise
 
-    def list_tables(self, dataset_id: str) -> List[Dict[str, Any]]:
+    def list_tables(self, dataset_id: str, page_size: int = TABLES_PAGE_SIZE) -> List[Dict[str, Any]]:
         """
         List all tables in a dataset
 
         Args:
             dataset_id: Dataset ID
+            page_size: Tables fetched per API page
 
         Returns:
             List of tables with metadata
         """
         try:
             dataset_ref = f"{self.project_id}.{dataset_id}"
-            tables = list(self.client.list_tables(dataset_ref))
+            tables = list(self.client.list_tables(dataset_ref, page_size=page_size))
             result = []
 
             for table in tables:
@@ -208,6 +274,28 @@ class BigQueryService:
             logger.error(f"Unexpected error getting table {dataset_id}.{table_id}: {e}")
             raise
 
+    @cached(
+        _table_cache,
+        key=lambda self, dataset_id, table_id: hashkey(self.project_id, dataset_id, table_id),
+        lock=_table_cache_lock
+    )
+    def get_table_schema(self, dataset_id: str, table_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the schema of a table for building agent context
+
+        Results are cached for 5 minutes and shared between callers,
+        so the returned list must not be modified. Table metadata
+        endpoints use get_table, which is never cached.
+
+        Args:
+            dataset_id: Dataset ID
+            table_id: Table ID
+
+        Returns:
+            Schema fields with name, type, mode and description
+        """
+        return self.get_table(dataset_id, table_id)["schema"]
+
     def execute_query(
         self,
         sql: str,
@@ -231,7 +319,7 @@ class BigQueryService:
         Returns:
             Query results with metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Configure query job
@@ -251,7 +339,7 @@ class BigQueryService:
             # Wait for completion
             result = query_job.result()
 
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Extract metadata
             metadata = {
@@ -275,14 +363,14 @@ class BigQueryService:
 
                 for row in result:
                     row_dict = {}
-                    for i, field in enumerate(result.schema):
+                    for i, name in enumerate(columns):
                         value = row[i]
                         # Convert to serializable types
                         if hasattr(value, 'isoformat'):  # datetime
                             value = value.isoformat()
                         elif hasattr(value, 'to_json'):  # geo data
                             value = str(value)
-                        row_dict[field.name] = value
+                        row_dict[name] = value
                     rows.append(row_dict)
 
             response = {
@@ -309,5 +397,16 @@ class BigQueryService:
             raise
 
 
-# Global service instance
-bigquery_service = BigQueryService()
+def __getattr__(name: str) -> Any:
+    """
+    Create the global service instance on first access
+
+    Importing this module (e.g. for BigQueryService in unit tests) does
+    not build a Google client; `from app.services.bigquery_service import
+    bigquery_service` does, once, and caches it as a module global.
+    """
+    if name == "bigquery_service":
+        service = BigQueryService()
+        globals()["bigquery_service"] = service
+        return service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,8 +5,9 @@ Handles subprocess communication with Claude Code CLI
 import asyncio
 import json
 import os
+import re
 import tempfile
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 from pathlib import Path
 from loguru import logger
 import shutil
@@ -14,6 +15,10 @@ import shutil
 from app.config import settings
 
 
+# Opening fence of a markdown code block, capturing the language tag
+_FENCE_OPEN_RE = re.compile(r"```(\w*)\n")
+
+
 class ClaudeCLIService:
     """
     Service for interacting with Claude Code CLI via subprocess
@@ -430,22 +435,50 @@ FROM `project.dataset.table`
             "reasoning": []
         }
 
+        code_blocks = list(_iter_code_blocks(output))
+
         # Extract SQL code blocks
-        import re
-        sql_pattern = r'```sql\n(.*?)\n```'
-        sql_matches = re.findall(sql_pattern, output, re.DOTALL)
+        sql_matches = [code for lang, code in code_blocks if lang == "sql"]
 
         if sql_matches:
             result["sql_query"] = sql_matches[0].strip()
-            result["code_blocks"] = sql_matches
 
         # Extract all code blocks
-        code_pattern = r'```(\w*)\n(.*?)\n```'
-        code_matches = re.findall(code_pattern, output, re.DOTALL)
-        result["code_blocks"] = [{"lang": lang, "code": code} for lang, code in code_matches]
+        result["code_blocks"] = [{"lang": lang, "code": code} for lang, code in code_blocks]
 
         return result
 
 
+def _iter_code_blocks(output: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (lang, code) for every fenced code block in the output
+
+    Equivalent to re.findall(r'```(\w*)\n(.*?)\n```', output, re.DOTALL),
+    but the closing fence is located with str.find, so the scan stays linear.
+    The lazy (.*?) re-scans to the end of the text from every unclosed
+    opening fence, which is quadratic on long or truncated CLI output.
+
+    Args:
+        output: Raw output from Claude CLI
+
+    Yields:
+        Tuples of (language tag, code block body)
+    """
+    pos = 0
+    while True:
+        opening = _FENCE_OPEN_RE.search(output, pos)
+        if not opening:
+            return
+
+        end = output.find("\n```", opening.end())
+        if end == -1:
+            # No closing fence anywhere after this point, so no later
+            # opening fence can be closed either
+            return
+
+        yield opening.group(1), output[opening.end():end]
+        pos = end + 4
+
+
 # Global service instance
 claude_cli_service = ClaudeCLIService()
@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import bigquery
+
+import app.services.bigquery_service as bigquery_service_module
+from app.services.bigquery_service import BigQueryService
+from app.services.claude_cli_service import claude_cli_service
+
+
+def _anonymous_bigquery_client(project, credentials=None):
+    """BigQuery client that needs no Application Default Credentials"""
+    return bigquery.Client(project=project, credentials=AnonymousCredentials())
+
+
+@pytest.fixture(scope="session")
+def settings_env_file(tmp_path_factory):
+    """Write a .env file once per session for Settings tests"""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
+    env_file.write_text(
+        "GOOGLE_APPLICATION_CREDENTIALS=/tmp/test-service-account.json\n"
+        "GCP_PROJECT_ID=test-project\n"
+        "BIGQUERY_LOCATION=EU\n"
+        'CORS_ORIGINS=["http://localhost:3000","https://cortex.example.com"]\n'
+        "LOG_LEVEL=DEBUG\n"
+    )
+    return str(env_file)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Single TestClient for the session, with no live startup checks"""
+    with pytest.MonkeyPatch.context() as mp:
+        # The app builds the global BigQueryService on import; give it
+        # anonymous credentials so starting the app needs no ADC
+        mp.setattr(bigquery_service_module, "Client", _anonymous_bigquery_client)
+
+        # Imported here so tests that don't need the app don't build it
+        from app.main import app
+
+        # The lifespan would otherwise send a live SELECT 1 to BigQuery
+        mp.setattr(bigquery_service_module.bigquery_service, "test_connection", lambda: False)
+        mp.setattr(claude_cli_service, "is_available", lambda: False)
+
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture(scope="session")
+def bq_service():
+    """BigQueryService built once per session without a real client"""
+    # __new__ skips __init__, which would build a real Client
+    service = BigQueryService.__new__(BigQueryService)
+    service.project_id = "test-project"
+    service.client = MagicMock(spec=bigquery.Client)
+    return service
+
+
+@pytest.fixture
+def mock_bigquery_client(bq_service):
+    """Shared mocked BigQuery client, reset before each test"""
+    bq_service.client.reset_mock(return_value=True, side_effect=True)
+    return bq_service.client
@@ -1,18 +1,24 @@
 """
 API Endpoint Tests
 """
-import pytest
-from fastapi.testclient import TestClient
+import socket
 
-from app.main import app
+import pytest
 
-client = TestClient(app)
+# Malformed SQL, sent as dry runs so nothing is ever executed
+INVALID_SQL_QUERIES = (
+    "INVALID SQL QUERY",
+    "SELECT FROM WHERE",
+    "SELECT * FROM",
+    "SELECT 1 UNION",
+    "SELECT * FROM `project.dataset.table` WHERE (id = 1",
+)
 
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test root endpoint"""
         response = client.get("/")
         assert response.status_code == 200
@@ -21,7 +27,7 @@ class TestHealthEndpoints:
         assert data["status"] == "running"
         assert "docs" in data
 
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint"""
         # Note: This will fail if BigQuery credentials are not configured
         response = client.get("/health")
@@ -29,10 +35,31 @@ class TestHealthEndpoints:
         assert response.status_code in [200, 503]
 
 
+class TestPublicEndpoints:
+    """Test endpoints that work without BigQuery access"""
+
+    @pytest.fixture(autouse=True)
+    def no_network(self, monkeypatch):
+        """Fail any outbound connection made while serving these endpoints"""
+        def refuse_connect(*args, **kwargs):
+            raise OSError("Public endpoint tests must not open network connections")
+
+        monkeypatch.setattr(socket.socket, "connect", refuse_connect)
+        monkeypatch.setattr(socket.socket, "connect_ex", refuse_connect)
+
+    # "/" has its own content test above; /health is left out because it
+    # returns 503 when BigQuery is unreachable (see test_health_check)
+    @pytest.mark.parametrize("endpoint", ["/docs", "/redoc", "/openapi.json"])
+    def test_public_endpoint(self, client, endpoint):
+        """Test public endpoint responds"""
+        response = client.get(endpoint)
+        assert response.status_code == 200
+
+
 class TestDatasetsEndpoints:
     """Test dataset endpoints"""
 
-    def test_list_datasets(self):
+    def test_list_datasets(self, client):
         """Test list datasets endpoint"""
         # Note: Requires valid BigQuery credentials
         response = client.get("/api/v1/datasets")
@@ -43,7 +70,7 @@ class TestDatasetsEndpoints:
 class TestTablesEndpoints:
     """Test table endpoints"""
 
-    def test_list_tables(self):
+    def test_list_tables(self, client):
         """Test list tables endpoint"""
         # Note: Requires valid BigQuery credentials and existing dataset
         response = client.get("/api/v1/datasets/nonexistent/tables")
@@ -54,12 +81,14 @@ class TestTablesEndpoints:
 class TestQueryEndpoints:
     """Test query endpoints"""
 
-    def test_direct_query_invalid(self):
+    @pytest.mark.parametrize("sql", INVALID_SQL_QUERIES)
+    def test_direct_query_invalid(self, client, sql):
         """Test direct query with invalid SQL"""
         response = client.post(
             "/api/v1/query",
             json={
-                "sql": "INVALID SQL QUERY"
+                "sql": sql,
+                "dry_run": True
             }
         )
         # Should return 400 (bad request) or 500 (not configured)
@@ -0,0 +1,331 @@
+"""
+BigQuery Service Tests
+"""
+import datetime
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud.bigquery.table import Row
+
+from app.config import settings
+from app.services.bigquery_service import _table_cache
+
+# Fixed timestamp for test metadata; no test asserts on wall-clock time
+_NOW = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def clear_table_cache():
+    """Drop cached table schemas left over from other tests"""
+    _table_cache.clear()
+
+
+class TestConnection:
+    """Test BigQuery connection check"""
+
+    def test_connection_success(self, bq_service, mock_bigquery_client):
+        """Test successful connection query"""
+        assert bq_service.test_connection() is True
+        mock_bigquery_client.query.assert_called_once_with("SELECT 1 as test")
+
+    def test_connection_failure(self, bq_service, mock_bigquery_client):
+        """Test connection errors are reported as False"""
+        mock_bigquery_client.query.side_effect = Exception("connection refused")
+        assert bq_service.test_connection() is False
+
+
+class TestDatasets:
+    """Test dataset operations"""
+
+    def test_list_datasets(self, bq_service, mock_bigquery_client, monkeypatch):
+        """Test datasets are listed with per-dataset API calls by default"""
+        monkeypatch.setattr(settings, "bigquery_use_information_schema", False)
+        mock_bigquery_client.list_datasets.return_value = [
+            SimpleNamespace(
+                dataset_id="analytics",
+                project="test-project",
+                reference="test-project.analytics"
+            )
+        ]
+        mock_bigquery_client.get_dataset.return_value = SimpleNamespace(
+            location="US",
+            created=_NOW,
+            modified=_NOW
+        )
+        mock_bigquery_client.list_tables.return_value = [SimpleNamespace(table_id="events")]
+
+        result = bq_service.list_datasets()
+
+        assert result == [{
+            "dataset_id": "analytics",
+            "project": "test-project",
+            "location": "US",
+            "tables_count": 1,
+            "created_at": _NOW,
+            "modified_at": _NOW
+        }]
+        mock_bigquery_client.query.assert_not_called()
+
+    def test_list_datasets_uses_information_schema(self, bq_service, mock_bigquery_client, monkeypatch):
+        """Test datasets are listed with one INFORMATION_SCHEMA query when enabled"""
+        monkeypatch.setattr(settings, "bigquery_use_information_schema", True)
+        monkeypatch.setattr(settings, "bigquery_location", "US")
+        mock_bigquery_client.query.return_value.result.return_value = [
+            {
+                "schema_name": "analytics",
+                "location": "US",
+                "creation_time": _NOW,
+                "last_modified_time": _NOW,
+                "tables_count": 3
+            }
+        ]
+
+        result = bq_service.list_datasets()
+
+        mock_bigquery_client.query.assert_called_once()
+        sql = mock_bigquery_client.query.call_args.args[0]
+        assert "`test-project`.`region-us`.INFORMATION_SCHEMA.SCHEMATA" in sql
+        mock_bigquery_client.list_datasets.assert_not_called()
+        mock_bigquery_client.get_dataset.assert_not_called()
+        mock_bigquery_client.list_tables.assert_not_called()
+        assert result == [{
+            "dataset_id": "analytics",
+            "project": "test-project",
+            "location": "US",
+            "tables_count": 3,
+            "created_at": _NOW,
+            "modified_at": _NOW
+        }]
+
+    def test_get_dataset(self, bq_service, mock_bigquery_client):
+        """Test dataset details include table count"""
+        mock_bigquery_client.get_dataset.return_value = SimpleNamespace(
+            dataset_id="analytics",
+            project="test-project",
+            location="US",
+            created=_NOW,
+            modified=_NOW
+        )
+        mock_bigquery_client.list_tables.return_value = [
+            SimpleNamespace(table_id="events"),
+            SimpleNamespace(table_id="users")
+        ]
+
+        result = bq_service.get_dataset("analytics")
+
+        mock_bigquery_client.get_dataset.assert_called_once_with("test-project.analytics")
+        assert result["dataset_id"] == "analytics"
+        assert result["location"] == "US"
+        assert result["tables_count"] == 2
+
+    def test_get_dataset_not_found(self, bq_service, mock_bigquery_client):
+        """Test not found errors propagate"""
+        mock_bigquery_client.get_dataset.side_effect = NotFound("Dataset missing")
+
+        with pytest.raises(NotFound):
+            bq_service.get_dataset("missing")
+
+
+class TestTables:
+    """Test table operations"""
+
+    def test_list_tables(self, bq_service, mock_bigquery_client):
+        """Test tables are listed with metadata"""
+        mock_bigquery_client.list_tables.return_value = [
+            SimpleNamespace(
+                table_id="events",
+                dataset_id="analytics",
+                project="test-project",
+                table_type="TABLE",
+                reference="test-project.analytics.events"
+            )
+        ]
+        mock_bigquery_client.get_table.return_value = SimpleNamespace(
+            num_rows=100,
+            num_bytes=2048,
+            created=_NOW,
+            modified=_NOW
+        )
+
+        result = bq_service.list_tables("analytics")
+
+        mock_bigquery_client.list_tables.assert_called_once_with(
+            "test-project.analytics", page_size=1000
+        )
+        assert len(result) == 1
+        assert result[0]["table_id"] == "events"
+        assert result[0]["num_rows"] == 100
+        assert result[0]["full_table_id"] == "test-project.analytics.events"
+
+    def test_list_tables_uses_page_size(self, bq_service, mock_bigquery_client):
+        """Test page size is passed through to the client"""
+        mock_bigquery_client.list_tables.return_value = []
+
+        bq_service.list_tables("analytics", page_size=500)
+
+        mock_bigquery_client.list_tables.assert_called_once_with(
+            "test-project.analytics", page_size=500
+        )
+
+    def test_get_table(self, bq_service, mock_bigquery_client):
+        """Test table details include schema"""
+        mock_bigquery_client.get_table.return_value = SimpleNamespace(
+            table_id="events",
+            dataset_id="analytics",
+            project="test-project",
+            table_type="TABLE",
+            num_rows=100,
+            num_bytes=2048,
+            created=_NOW,
+            modified=_NOW,
+            schema=[
+                SimpleNamespace(
+                    name="id",
+                    field_type="INTEGER",
+                    mode="REQUIRED",
+                    description="Primary key"
+                )
+            ]
+        )
+
+        result = bq_service.get_table("analytics", "events")
+
+        mock_bigquery_client.get_table.assert_called_once_with("test-project.analytics.events")
+        assert result["full_table_id"] == "test-project.analytics.events"
+        assert result["schema"] == [
+            {"name": "id", "type": "INTEGER", "mode": "REQUIRED", "description": "Primary key"}
+        ]
+
+    def test_get_table_not_cached(self, bq_service, mock_bigquery_client):
+        """Test table details are always fetched fresh"""
+        mock_bigquery_client.get_table.return_value = SimpleNamespace(
+            table_id="events",
+            dataset_id="analytics",
+            project="test-project",
+            table_type="TABLE",
+            num_rows=100,
+            num_bytes=2048,
+            created=_NOW,
+            modified=_NOW,
+            schema=[]
+        )
+
+        bq_service.get_table("analytics", "events")
+        bq_service.get_table("analytics", "events")
+
+        assert mock_bigquery_client.get_table.call_count == 2
+
+    def test_get_table_schema_cache_hit(self, bq_service, mock_bigquery_client):
+        """Test repeated schema lookups are served from the cache until the TTL expires"""
+        mock_bigquery_client.get_table.return_value = SimpleNamespace(
+            table_id="events",
+            dataset_id="analytics",
+            project="test-project",
+            table_type="TABLE",
+            num_rows=100,
+            num_bytes=2048,
+            created=_NOW,
+            modified=_NOW,
+            schema=[
+                SimpleNamespace(
+                    name="id",
+                    field_type="INTEGER",
+                    mode="REQUIRED",
+                    description=None
+                )
+            ]
+        )
+
+        first = bq_service.get_table_schema("analytics", "events")
+        second = bq_service.get_table_schema("analytics", "events")
+
+        assert first == [{"name": "id", "type": "INTEGER", "mode": "REQUIRED", "description": None}]
+        assert second == first
+        assert mock_bigquery_client.get_table.call_count == 1
+
+        _table_cache.expire(time.monotonic() + 301)
+        bq_service.get_table_schema("analytics", "events")
+
+        assert mock_bigquery_client.get_table.call_count == 2
+
+    def test_get_table_schema_errors_not_cached(self, bq_service, mock_bigquery_client):
+        """Test failed schema lookups are retried"""
+        mock_bigquery_client.get_table.side_effect = NotFound("Table missing")
+
+        for _ in range(2):
+            with pytest.raises(NotFound):
+                bq_service.get_table_schema("analytics", "missing")
+
+        assert mock_bigquery_client.get_table.call_count == 2
+
+
+class TestExecuteQuery:
+    """Test query execution"""
+
+    def test_execute_query(self, bq_service, mock_bigquery_client):
+        """Test rows are converted to dicts with metadata"""
+        field_index = {"id": 0, "name": 1}
+        mock_result = MagicMock()
+        mock_result.schema = [SimpleNamespace(name="id"), SimpleNamespace(name="name")]
+        mock_result.__iter__.return_value = iter([
+            Row((1, "Test 1"), field_index),
+            Row((2, "Test 2"), field_index)
+        ])
+        mock_job = MagicMock()
+        mock_job.job_id = "job-123"
+        mock_job.total_bytes_processed = 1024
+        mock_job.total_bytes_billed = 10485760
+        mock_job.cache_hit = False
+        mock_job.slot_millis = 50
+        mock_job.result.return_value = mock_result
+        mock_bigquery_client.query.return_value = mock_job
+
+        result = bq_service.execute_query("SELECT id, name FROM t")
+
+        assert result["columns"] == ["id", "name"]
+        assert result["data"] == [
+            {"id": 1, "name": "Test 1"},
+            {"id": 2, "name": "Test 2"}
+        ]
+        assert result["row_count"] == 2
+        assert result["metadata"]["job_id"] == "job-123"
+        assert result["metadata"]["execution_time_ms"] >= 0
+
+    def test_execute_query_serializes_values(self, bq_service, mock_bigquery_client):
+        """Test datetime values are returned as ISO strings"""
+        mock_result = MagicMock()
+        mock_result.schema = [SimpleNamespace(name="id"), SimpleNamespace(name="created_at")]
+        mock_result.__iter__.return_value = iter([Row((1, _NOW), {"id": 0, "created_at": 1})])
+        mock_bigquery_client.query.return_value.result.return_value = mock_result
+
+        result = bq_service.execute_query("SELECT id, created_at FROM t")
+
+        assert result["data"] == [{"id": 1, "created_at": "2024-01-01T12:00:00"}]
+
+    def test_execute_query_options(self, bq_service, mock_bigquery_client):
+        """Test job config and timeout are passed to the client"""
+        mock_bigquery_client.query.return_value.result.return_value.schema = []
+
+        bq_service.execute_query(
+            "SELECT 1",
+            project_id="other-project",
+            dry_run=True,
+            timeout_ms=5000,
+            use_query_cache=False
+        )
+
+        _, kwargs = mock_bigquery_client.query.call_args
+        assert kwargs["project"] == "other-project"
+        assert kwargs["timeout"] == 5
+        assert kwargs["job_config"].dry_run is True
+        assert kwargs["job_config"].use_query_cache is False
+
+    def test_execute_query_error(self, bq_service, mock_bigquery_client):
+        """Test client errors propagate"""
+        mock_bigquery_client.query.side_effect = NotFound("Table missing")
+
+        with pytest.raises(NotFound):
+            bq_service.execute_query("SELECT * FROM missing")
@@ -0,0 +1,49 @@
+"""
+Claude CLI Service Tests
+"""
+import pytest
+
+from app.services.claude_cli_service import claude_cli_service
+
+# Truncated CLI output with 50k opening fences and no closing fence,
+# built once so the timed test only measures parsing
+UNCLOSED_FENCES_OUTPUT = "".join(f"```sql\nSELECT {i};" for i in range(50000))
+
+
+class TestParseOutput:
+    """Test extraction of SQL and code blocks from Claude CLI output"""
+
+    def test_extracts_sql_query(self):
+        """Test first SQL block is returned as the query"""
+        output = (
+            "Here is the query:\n"
+            "```sql\nSELECT 1\n```\n"
+            "And an alternative:\n"
+            "```sql\nSELECT 2\n```\n"
+        )
+        result = claude_cli_service._parse_output(output)
+        assert result["sql_query"] == "SELECT 1"
+        assert result["text"] == output
+
+    def test_collects_all_code_blocks(self):
+        """Test code blocks of every language are collected in order"""
+        output = "```python\nprint(1)\n```\n```\nplain\n```\n```sql\nSELECT 1\n```"
+        result = claude_cli_service._parse_output(output)
+        assert result["code_blocks"] == [
+            {"lang": "python", "code": "print(1)"},
+            {"lang": "", "code": "plain"},
+            {"lang": "sql", "code": "SELECT 1"},
+        ]
+
+    def test_no_code_blocks(self):
+        """Test plain text output yields no SQL"""
+        result = claude_cli_service._parse_output("I could not find that table.")
+        assert result["sql_query"] is None
+        assert result["code_blocks"] == []
+
+    @pytest.mark.timeout(1)
+    def test_unclosed_fences_parse_in_linear_time(self):
+        """Test truncated output with many unclosed fences does not backtrack"""
+        result = claude_cli_service._parse_output(UNCLOSED_FENCES_OUTPUT)
+        assert result["sql_query"] is None
+        assert result["code_blocks"] == []
@@ -0,0 +1,32 @@
+"""
+Configuration Tests
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+class TestSettings:
+    """Test settings loading and validation"""
+
+    def test_load_from_env_file(self, settings_env_file, monkeypatch):
+        """Test settings are read from a .env file"""
+        for name in ("BIGQUERY_LOCATION", "CORS_ORIGINS", "LOG_LEVEL"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = Settings(_env_file=settings_env_file)
+
+        assert settings.bigquery_location == "EU"
+        assert settings.cors_origins == [
+            "http://localhost:3000",
+            "https://cortex.example.com"
+        ]
+        assert settings.log_level == "DEBUG"
+
+    def test_missing_project_id(self, monkeypatch):
+        """Test GCP project ID is required"""
+        monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+
+        with pytest.raises(ValidationError, match="GCP_PROJECT_ID must be set"):
+            Settings(_env_file=None)
@@ -0,0 +1,37 @@
+"""
+Model Validation Tests
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.models.bigquery import DirectQueryRequest
+
+
+class TestDirectQueryRequest:
+    """Test direct query request validation"""
+
+    def test_defaults(self):
+        """Test a minimal request gets default options"""
+        request = DirectQueryRequest(sql="SELECT * FROM t")
+        assert request.project_id is None
+        assert request.dry_run is False
+        assert request.timeout_ms == 60000
+        assert request.use_query_cache is True
+        assert request.use_legacy_sql is False
+
+    @pytest.mark.parametrize("timeout_ms", [1000, 300000])
+    def test_timeout_bounds_accepted(self, timeout_ms):
+        """Test timeout limits are inclusive"""
+        request = DirectQueryRequest(sql="SELECT * FROM t", timeout_ms=timeout_ms)
+        assert request.timeout_ms == timeout_ms
+
+    @pytest.mark.parametrize("overrides", [
+        {"timeout_ms": 100},
+        {"timeout_ms": 500000},
+        {"sql": ""},
+    ])
+    def test_invalid_request(self, overrides):
+        """Test out-of-range timeout and empty SQL are rejected"""
+        kwargs = {"sql": "SELECT * FROM t", **overrides}
+        with pytest.raises(ValidationError):
+            DirectQueryRequest(**kwargs)